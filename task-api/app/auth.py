@@ -5,12 +5,21 @@ This module handles JWT token creation, validation, and user authentication
 for the API endpoints.
 """
 
+import hashlib
+import hmac
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
-from fastapi import Depends, HTTPException, status
+from typing import Optional, Tuple
+import jwt
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from jwt.exceptions import PyJWTError as JWTError
+from jwt.utils import base64url_decode
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
 from app import crud, models, schemas
 from app.database import get_db
 
@@ -20,8 +29,88 @@ SECRET_KEY = "your-secret-key-here-change-in-production"  # Change this in produ
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# HS256 keyed once at import; copy() reuses the precomputed ipad/opad state
+_hmac_template = hmac.new(SECRET_KEY.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+class BearerTokenScheme(OAuth2PasswordBearer):
+    """
+    OAuth2 password-flow scheme with a lean token extraction path.
+    
+    Subclassing keeps the scheme registered in the OpenAPI docs while
+    replacing the header parsing with a single prefix check.
+    """
+    
+    async def __call__(self, request: Request) -> Optional[str]:
+        authorization = request.headers.get("authorization")
+        # Auth scheme names are case-insensitive, so compare the prefix lowercased
+        if authorization and authorization[:7].lower() == "bearer ":
+            return authorization[7:]
+        if not self.auto_error:
+            return None
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
 # OAuth2 scheme for token extraction
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+oauth2_scheme = BearerTokenScheme(tokenUrl="auth/login", scheme_name="OAuth2PasswordBearer")
+
+# Short-lived caches for decoded tokens (token -> (email, exp)) and
+# authenticated users (email -> detached User). Never outlive token expiry.
+AUTH_CACHE_TTL_SECONDS = 60
+_token_cache: TTLCache = TTLCache(maxsize=4096, ttl=AUTH_CACHE_TTL_SECONDS)
+_user_cache: TTLCache = TTLCache(maxsize=4096, ttl=AUTH_CACHE_TTL_SECONDS)
+_cache_lock = threading.Lock()
+
+# Tokens issued by recent successful logins, keyed by (email, sha256(password)),
+# so a client retrying the same login gets the same token without another
+# bcrypt verify. Failed logins are never cached.
+LOGIN_CACHE_TTL_SECONDS = 2
+_login_cache: TTLCache = TTLCache(maxsize=1024, ttl=LOGIN_CACHE_TTL_SECONDS)
+
+
+def clear_auth_caches() -> None:
+    """Drop all cached tokens, users and logins (e.g. on logout or in tests)."""
+    with _cache_lock:
+        _token_cache.clear()
+        _user_cache.clear()
+        _login_cache.clear()
+
+
+def _login_cache_key(email: str, password: str) -> Tuple[str, bytes]:
+    """Build a login cache key without keeping the plain password around."""
+    return email, hashlib.sha256(password.encode("utf-8")).digest()
+
+
+def get_cached_login_token(email: str, password: str) -> Optional[str]:
+    """
+    Get the token issued by a matching successful login in the last few seconds.
+    
+    Args:
+        email: Email address from the login form
+        password: Plain text password from the login form
+        
+    Returns:
+        The previously issued access token, or None if there isn't one
+    """
+    with _cache_lock:
+        return _login_cache.get(_login_cache_key(email, password))
+
+
+def cache_login_token(email: str, password: str, token: str) -> None:
+    """
+    Remember the token issued for a successful login.
+    
+    Args:
+        email: Email address from the login form
+        password: Plain text password that was verified
+        token: The access token that was issued
+    """
+    with _cache_lock:
+        _login_cache[_login_cache_key(email, password)] = token
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -46,10 +135,33 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def _verify_signature(token: str) -> bool:
+    """
+    Check a JWT's HS256 signature against SECRET_KEY.
+    
+    Args:
+        token: The compact-serialized JWT
+        
+    Returns:
+        True if the signature is valid, False otherwise
+    """
+    signing_input, _, signature = token.rpartition(".")
+    try:
+        expected = base64url_decode(signature.encode("ascii"))
+        mac = _hmac_template.copy()
+        mac.update(signing_input.encode("ascii"))
+    except ValueError:
+        return False
+    return hmac.compare_digest(mac.digest(), expected)
+
+
 def verify_token(token: str, credentials_exception: HTTPException) -> schemas.TokenData:
     """
     Verify and decode a JWT token.
     
+    Decoded tokens are cached until the cache TTL or the token's own
+    expiry, whichever comes first.
+    
     Args:
         token: The JWT token to verify
         credentials_exception: Exception to raise if verification fails
@@ -60,20 +172,72 @@ def verify_token(token: str, credentials_exception: HTTPException) -> schemas.To
     Raises:
         HTTPException: If token is invalid or expired
     """
+    with _cache_lock:
+        cached = _token_cache.get(token)
+    if cached is not None and cached[1] > time.time():
+        return schemas.TokenData(email=cached[0])
+    
+    try:
+        # Only accept tokens declaring the algorithm we sign with
+        header = jwt.get_unverified_header(token)
+    except JWTError:
+        raise credentials_exception
+    if header.get("alg") != ALGORITHM or not _verify_signature(token):
+        raise credentials_exception
+    
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        # Signature already checked above; PyJWT only validates the claims
+        payload = jwt.decode(
+            token, options={"verify_signature": False, "verify_exp": True}
+        )
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
+        expires_at = payload.get("exp")
+        if expires_at is not None:
+            with _cache_lock:
+                _token_cache[token] = (email, expires_at)
         token_data = schemas.TokenData(email=email)
         return token_data
     except JWTError:
         raise credentials_exception
 
 
-def get_current_user(
+async def _get_user_cached(db: AsyncSession, email: str) -> Optional[models.User]:
+    """
+    Look up a user by email, reusing a cached copy when available.
+    
+    The cache holds detached snapshots of every column, merged into the
+    request's session without issuing a SELECT; relationships are not
+    loaded. Missing users are not cached.
+    
+    Args:
+        db: Database session
+        email: The user's email address
+        
+    Returns:
+        User object bound to ``db`` if found, None otherwise
+    """
+    with _cache_lock:
+        snapshot = _user_cache.get(email)
+    if snapshot is not None:
+        return await db.merge(snapshot, load=False)
+    
+    user = await crud.get_user_by_email(db, email=email)
+    if user is not None:
+        snapshot = models.User(**{
+            attr.key: getattr(user, attr.key)
+            for attr in sa_inspect(models.User).column_attrs
+        })
+        make_transient_to_detached(snapshot)
+        with _cache_lock:
+            _user_cache[email] = snapshot
+    return user
+
+
+async def get_current_user(
     token: str = Depends(oauth2_scheme), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> models.User:
     """
     Get the current authenticated user from JWT token.
@@ -98,13 +262,13 @@ def get_current_user(
     )
     
     token_data = verify_token(token, credentials_exception)
-    user = crud.get_user_by_email(db, email=token_data.email)
+    user = await _get_user_cached(db, email=token_data.email)
     if user is None:
         raise credentials_exception
     return user
 
 
-def get_current_active_user(
+async def get_current_active_user(
     current_user: models.User = Depends(get_current_user)
 ) -> models.User:
     """
@@ -5,14 +5,47 @@ This module contains all database operations, providing a clean interface
 between the API endpoints and the database models.
 """
 
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List
+import bcrypt
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from app import models, schemas
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing
+# Work factor is 2^BCRYPT_ROUNDS; tests lower it to keep fixtures fast.
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+
+# bcrypt releases the GIL while hashing, so threads run in parallel without
+# process-pool IPC. A dedicated pool sized to the CPUs keeps hashing from
+# oversubscribing cores or starving the event loop's default threadpool.
+PASSWORD_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="password-hash"
+)
+
+# Marks hashes of the SHA-256 pre-hashed password. Hashes without it are
+# legacy bcrypt hashes of the raw password and get upgraded on next login.
+PREHASH_MARKER = "sha256$"
+
+
+def _prep_password(password: str) -> str:
+    """
+    Pre-hash a password with SHA-256 before handing it to bcrypt.
+    
+    bcrypt silently truncates input at 72 bytes and stops at NUL bytes;
+    feeding it a fixed-length hex digest avoids both.
+    
+    Args:
+        password: The plain text password
+        
+    Returns:
+        Hex-encoded SHA-256 digest of the password
+    """
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -26,7 +59,29 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if hashed_password.startswith(PREHASH_MARKER):
+        return bcrypt.checkpw(
+            _prep_password(plain_password).encode("ascii"),
+            hashed_password[len(PREHASH_MARKER):].encode("ascii"),
+        )
+    # Legacy hash of the raw password; bcrypt only ever saw its first 72 bytes
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8")[:72],
+        hashed_password.encode("ascii"),
+    )
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash predates SHA-256 pre-hashing.
+    
+    Args:
+        hashed_password: The stored password hash
+        
+    Returns:
+        True if the hash should be replaced with ``get_password_hash``
+    """
+    return not hashed_password.startswith(PREHASH_MARKER)
 
 
 def get_password_hash(password: str) -> str:
@@ -39,11 +94,14 @@ def get_password_hash(password: str) -> str:
     Returns:
         The hashed password string
     """
-    return pwd_context.hash(password)
+    return PREHASH_MARKER + bcrypt.hashpw(
+        _prep_password(password).encode("ascii"),
+        bcrypt.gensalt(rounds=BCRYPT_ROUNDS),
+    ).decode("ascii")
 
 
 # User CRUD operations
-def get_user(db: Session, user_id: int) -> Optional[models.User]:
+async def get_user(db: AsyncSession, user_id: int) -> Optional[models.User]:
     """
     Get a user by ID.
     
@@ -54,10 +112,10 @@ def get_user(db: Session, user_id: int) -> Optional[models.User]:
     Returns:
         User object if found, None otherwise
     """
-    return db.query(models.User).filter(models.User.id == user_id).first()
+    return await db.get(models.User, user_id)
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[models.User]:
     """
     Get a user by email address.
     
@@ -68,10 +126,32 @@ def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
     Returns:
         User object if found, None otherwise
     """
-    return db.query(models.User).filter(models.User.email == email).first()
+    result = await db.execute(
+        select(models.User).where(models.User.email == email)
+    )
+    return result.scalar_one_or_none()
 
 
-def create_user(db: Session, user: schemas.UserCreate) -> models.User:
+async def get_users_by_emails(db: AsyncSession, emails: List[str]) -> Dict[str, models.User]:
+    """
+    Get several users by email address in a single query.
+    
+    Args:
+        db: Database session
+        emails: Email addresses to look up
+        
+    Returns:
+        Mapping of email to User object; emails with no user are omitted
+    """
+    if not emails:
+        return {}
+    result = await db.scalars(
+        select(models.User).where(models.User.email.in_(set(emails)))
+    )
+    return {user.email: user for user in result}
+
+
+async def create_user(db: AsyncSession, user: schemas.UserCreate) -> models.User:
     """
     Create a new user with hashed password.
     
@@ -82,21 +162,27 @@ def create_user(db: Session, user: schemas.UserCreate) -> models.User:
     Returns:
         The created user object
     """
-    hashed_password = get_password_hash(user.password)
+    # bcrypt is CPU-bound; keep it off the event loop
+    loop = asyncio.get_running_loop()
+    hashed_password = await loop.run_in_executor(
+        PASSWORD_POOL, get_password_hash, user.password
+    )
     db_user = models.User(
         email=user.email,
         hashed_password=hashed_password
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
     return db_user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[models.User]:
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[models.User]:
     """
     Authenticate a user by email and password.
     
+    A legacy password hash is replaced with the current scheme after a
+    successful login.
+    
     Args:
         db: Database session
         email: User's email address
@@ -105,38 +191,89 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[models
     Returns:
         User object if authentication successful, None otherwise
     """
-    user = get_user_by_email(db, email)
+    user = await get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(
+        PASSWORD_POOL, verify_password, password, user.hashed_password
+    ):
         return None
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await loop.run_in_executor(
+            PASSWORD_POOL, get_password_hash, password
+        )
+        await db.commit()
     return user
 
 
 # Task CRUD operations
-def get_tasks(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.Task]:
+async def _adjust_task_count(db: AsyncSession, user_id: int, delta: int) -> None:
     """
-    Get tasks for a specific user with pagination.
+    Add ``delta`` to a user's denormalized task count.
+    
+    Runs in the caller's transaction so the count commits together with
+    the task rows it describes.
+    
+    Args:
+        db: Database session
+        user_id: The user's ID
+        delta: Amount to add (negative to subtract)
+    """
+    await db.execute(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(task_count=models.User.task_count + delta)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def get_task_count(db: AsyncSession, user_id: int) -> int:
+    """
+    Get the number of tasks a user owns.
+    
+    Reads the denormalized counter instead of counting task rows.
     
     Args:
         db: Database session
         user_id: The user's ID
-        skip: Number of records to skip (for pagination)
-        limit: Maximum number of records to return
         
     Returns:
-        List of task objects
+        The user's task count, or 0 if the user doesn't exist
     """
-    return (
-        db.query(models.Task)
-        .filter(models.Task.user_id == user_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    result = await db.scalar(
+        select(models.User.task_count).where(models.User.id == user_id)
     )
+    return result or 0
 
 
-def get_task(db: Session, task_id: int, user_id: int) -> Optional[models.Task]:
+async def get_tasks(
+    db: AsyncSession, 
+    user_id: int, 
+    after_id: Optional[int] = None, 
+    limit: int = 100
+) -> List[models.Task]:
+    """
+    Get tasks for a specific user with keyset pagination.
+    
+    Args:
+        db: Database session
+        user_id: The user's ID
+        after_id: Only return tasks with an ID greater than this
+            (the last ID of the previous page); None starts from the beginning
+        limit: Maximum number of records to return
+        
+    Returns:
+        List of task objects ordered by ID
+    """
+    stmt = select(models.Task).where(models.Task.user_id == user_id)
+    if after_id is not None:
+        stmt = stmt.where(models.Task.id > after_id)
+    result = await db.scalars(stmt.order_by(models.Task.id).limit(limit))
+    return result.all()
+
+
+async def get_task(db: AsyncSession, task_id: int, user_id: int) -> Optional[models.Task]:
     """
     Get a specific task by ID for a user.
     
@@ -148,14 +285,15 @@ def get_task(db: Session, task_id: int, user_id: int) -> Optional[models.Task]:
     Returns:
         Task object if found and belongs to user, None otherwise
     """
-    return (
-        db.query(models.Task)
-        .filter(models.Task.id == task_id, models.Task.user_id == user_id)
-        .first()
+    result = await db.execute(
+        select(models.Task).where(
+            models.Task.id == task_id, models.Task.user_id == user_id
+        )
     )
+    return result.scalar_one_or_none()
 
 
-def create_task(db: Session, task: schemas.TaskCreate, user_id: int) -> models.Task:
+async def create_task(db: AsyncSession, task: schemas.TaskCreate, user_id: int) -> models.Task:
     """
     Create a new task for a user.
     
@@ -174,13 +312,57 @@ def create_task(db: Session, task: schemas.TaskCreate, user_id: int) -> models.T
         user_id=user_id
     )
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    await _adjust_task_count(db, user_id, 1)
+    await db.commit()
     return db_task
 
 
-def update_task(
-    db: Session, 
+async def create_tasks_bulk(
+    db: AsyncSession, 
+    tasks: List[schemas.TaskCreate], 
+    user_id: int
+) -> List[models.Task]:
+    """
+    Create several tasks for a user in a single transaction.
+    
+    Args:
+        db: Database session
+        tasks: Task creation schemas
+        user_id: The user's ID
+        
+    Returns:
+        The created task objects, in the order they were given
+    """
+    if not tasks:
+        return []
+    
+    mappings = [
+        {
+            "title": task.title,
+            "description": task.description,
+            "priority": task.priority,
+            "user_id": user_id,
+        }
+        for task in tasks
+    ]
+    result = await db.scalars(
+        insert(models.Task).returning(models.Task.id, sort_by_parameter_order=True),
+        mappings,
+    )
+    task_ids = result.all()
+    await _adjust_task_count(db, user_id, len(task_ids))
+    await db.commit()
+    
+    result = await db.scalars(
+        select(models.Task)
+        .where(models.Task.id.in_(task_ids))
+        .order_by(models.Task.id)
+    )
+    return result.all()
+
+
+async def update_task(
+    db: AsyncSession, 
     task_id: int, 
     task: schemas.TaskUpdate, 
     user_id: int
@@ -197,21 +379,24 @@ def update_task(
     Returns:
         Updated task object if found and belongs to user, None otherwise
     """
-    db_task = get_task(db, task_id, user_id)
-    if not db_task:
-        return None
-    
     # Update only provided fields
     update_data = task.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_task, field, value)
+    if not update_data:
+        return await get_task(db, task_id, user_id)
     
-    db.commit()
-    db.refresh(db_task)
+    stmt = (
+        update(models.Task)
+        .where(models.Task.id == task_id, models.Task.user_id == user_id)
+        .values(**update_data)
+        .returning(models.Task)
+    )
+    result = await db.execute(stmt)
+    db_task = result.scalar_one_or_none()
+    await db.commit()
     return db_task
 
 
-def delete_task(db: Session, task_id: int, user_id: int) -> Optional[models.Task]:
+async def delete_task(db: AsyncSession, task_id: int, user_id: int) -> Optional[models.Task]:
     """
     Delete a task for a user.
     
@@ -223,10 +408,14 @@ def delete_task(db: Session, task_id: int, user_id: int) -> Optional[models.Task
     Returns:
         Deleted task object if found and belongs to user, None otherwise
     """
-    db_task = get_task(db, task_id, user_id)
-    if not db_task:
-        return None
-    
-    db.delete(db_task)
-    db.commit()
+    stmt = (
+        delete(models.Task)
+        .where(models.Task.id == task_id, models.Task.user_id == user_id)
+        .returning(models.Task)
+    )
+    result = await db.execute(stmt)
+    db_task = result.scalar_one_or_none()
+    if db_task is not None:
+        await _adjust_task_count(db, user_id, -1)
+    await db.commit()
     return db_task
\ No newline at end of file
@@ -1,21 +1,25 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
 SQLITE_DATABASE_URL = "sqlite:///./task_management.db"
+ASYNC_SQLITE_DATABASE_URL = "sqlite+aiosqlite:///./task_management.db"
 
+# Sync engine is only used for schema management (create_all)
 engine = create_engine(
-    SQLITE_DATABASE_URL, 
+    SQLITE_DATABASE_URL,
     connect_args={"check_same_thread": False}
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine(ASYNC_SQLITE_DATABASE_URL)
+
+# Objects must stay usable after commit: async sessions can't lazy-load
+SessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+async def get_db():
+    async with SessionLocal() as db:
+        yield db
\ No newline at end of file
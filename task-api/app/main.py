@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.database import engine
 from app import models
 from app.routers import auth, tasks
@@ -10,7 +11,8 @@ models.Base.metadata.create_all(bind=engine)
 app = FastAPI(
     title="Task Management API",
     description="A comprehensive task management API with user authentication",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -20,6 +22,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count"],
 )
 
 # Include routers
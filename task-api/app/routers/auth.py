@@ -1,26 +1,36 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app import crud, schemas
 from app.database import get_db
-from app.auth import create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.auth import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    cache_login_token,
+    create_access_token,
+    get_cached_login_token,
+)
 
 router = APIRouter()
 
 @router.post("/register", response_model=schemas.User)
-def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
-    db_user = crud.get_user_by_email(db, email=user.email)
+async def register_user(user: schemas.UserCreate, db: AsyncSession = Depends(get_db)):
+    db_user = await crud.get_user_by_email(db, email=user.email)
     if db_user:
         raise HTTPException(
             status_code=400,
             detail="Email already registered"
         )
-    return crud.create_user(db=db, user=user)
+    return await crud.create_user(db=db, user=user)
 
 @router.post("/login", response_model=schemas.Token)
-def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = crud.authenticate_user(db, form_data.username, form_data.password)
+async def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
+    # Retried logins (e.g. flaky mobile networks) reuse the token just issued
+    access_token = get_cached_login_token(form_data.username, form_data.password)
+    if access_token is not None:
+        return {"access_token": access_token, "token_type": "bearer"}
+    
+    user = await crud.authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -31,4 +41,5 @@ def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = D
     access_token = create_access_token(
         data={"sub": user.email}, expires_delta=access_token_expires
     )
+    cache_login_token(form_data.username, form_data.password, access_token)
     return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
@@ -1,60 +1,84 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from app import crud, schemas, models
 from app.database import get_db
 from app.auth import get_current_user
 
 router = APIRouter()
 
+# Largest batch accepted by POST /tasks/bulk (one transaction, one response)
+MAX_BULK_TASKS = 100
+
+# Validates ORM rows and encodes them to JSON in one pydantic-core pass
+_TASKS_ADAPTER = TypeAdapter(List[schemas.Task])
+
 @router.get("/", response_model=List[schemas.Task])
-def read_tasks(
-    skip: int = 0,
+async def read_tasks(
+    after_id: Optional[int] = None,
     limit: int = 100,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    tasks = crud.get_tasks(db, user_id=current_user.id, skip=skip, limit=limit)
-    return tasks
+    tasks = await crud.get_tasks(db, user_id=current_user.id, after_id=after_id, limit=limit)
+    task_count = await crud.get_task_count(db, user_id=current_user.id)
+    # Returning a Response skips FastAPI's own validate/serialize of the list;
+    # response_model is kept for the OpenAPI schema
+    return Response(
+        content=_TASKS_ADAPTER.dump_json(
+            _TASKS_ADAPTER.validate_python(tasks, from_attributes=True)
+        ),
+        media_type="application/json",
+        headers={"X-Total-Count": str(task_count)},
+    )
 
 @router.post("/", response_model=schemas.Task)
-def create_task(
+async def create_task(
     task: schemas.TaskCreate,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
+):
+    return await crud.create_task(db=db, task=task, user_id=current_user.id)
+
+@router.post("/bulk", response_model=List[schemas.Task])
+async def create_tasks_bulk(
+    tasks: List[schemas.TaskCreate] = Body(..., max_length=MAX_BULK_TASKS),
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    return crud.create_task(db=db, task=task, user_id=current_user.id)
+    return await crud.create_tasks_bulk(db=db, tasks=tasks, user_id=current_user.id)
 
 @router.get("/{task_id}", response_model=schemas.Task)
-def read_task(
+async def read_task(
     task_id: int,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    db_task = crud.get_task(db, task_id=task_id, user_id=current_user.id)
+    db_task = await crud.get_task(db, task_id=task_id, user_id=current_user.id)
     if db_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     return db_task
 
 @router.put("/{task_id}", response_model=schemas.Task)
-def update_task(
+async def update_task(
     task_id: int,
     task: schemas.TaskUpdate,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    db_task = crud.update_task(db, task_id=task_id, task=task, user_id=current_user.id)
+    db_task = await crud.update_task(db, task_id=task_id, task=task, user_id=current_user.id)
     if db_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     return db_task
 
 @router.delete("/{task_id}")
-def delete_task(
+async def delete_task(
     task_id: int,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    db_task = crud.delete_task(db, task_id=task_id, user_id=current_user.id)
+    db_task = await crud.delete_task(db, task_id=task_id, user_id=current_user.id)
     if db_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     return {"message": "Task deleted successfully"}
\ No newline at end of file
@@ -5,6 +5,7 @@ This module defines the data models used for API requests and responses,
 providing automatic validation, serialization, and documentation.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field
@@ -73,6 +74,7 @@ class Token(BaseModel):
     token_type: str
 
 
-class TokenData(BaseModel):
-    """Schema for token payload data."""
+@dataclass(slots=True)
+class TokenData:
+    """Token payload data; built on every authenticated request, so kept as a plain dataclass."""
     email: Optional[str] = None
\ No newline at end of file
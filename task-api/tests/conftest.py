@@ -1,21 +1,54 @@
+import os
+
+# Cheap bcrypt cost for tests; must be set before app modules are imported
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.main import app
+from app.auth import clear_auth_caches
 from app.database import get_db, Base
 
-# Create test database
-SQLITE_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(SQLITE_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create test database: one shared in-memory SQLite database, seen by both the
+# sync engine (schema setup) and the async engine (app sessions)
+SQLITE_DATABASE_URL = "sqlite:///file::memory:?cache=shared&uri=true"
+ASYNC_SQLITE_DATABASE_URL = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
+engine = create_engine(
+    SQLITE_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+async_engine = create_async_engine(
+    ASYNC_SQLITE_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # Tests don't need durability; skip fsyncs and keep journals in memory
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+event.listen(engine, "connect", set_sqlite_pragmas)
+event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+
+TestingSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+# Sync sessions for arranging or inspecting rows directly in tests
+SyncTestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async def override_get_db():
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 app.dependency_overrides[get_db] = override_get_db
 
@@ -25,6 +58,23 @@ def client():
     with TestClient(app) as c:
         yield c
     Base.metadata.drop_all(bind=engine)
+    clear_auth_caches()
+
+@pytest.fixture
+def db_session(client):
+    db = SyncTestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@pytest_asyncio.fixture
+async def async_db():
+    Base.metadata.create_all(bind=engine)
+    async with TestingSessionLocal() as db:
+        yield db
+    Base.metadata.drop_all(bind=engine)
+    clear_auth_caches()
 
 @pytest.fixture
 def test_user():
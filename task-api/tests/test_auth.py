@@ -1,5 +1,17 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime, timedelta
+
+import bcrypt
+import jwt
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import inspect as sa_inspect
+from app import auth, crud, models, schemas
+from app.auth import ALGORITHM, SECRET_KEY, clear_auth_caches, create_access_token
 
 def test_register_user(client: TestClient):
     response = client.post(
@@ -43,4 +55,199 @@ def test_login_invalid_credentials(client: TestClient):
         data={"username": "nonexistent@example.com", "password": "wrongpassword"}
     )
     assert response.status_code == 401
-    assert "Incorrect email or password" in response.json()["detail"]
\ No newline at end of file
+    assert "Incorrect email or password" in response.json()["detail"]
+
+def test_login_long_password_not_truncated(client: TestClient):
+    # bcrypt alone would only see the first 72 bytes of these passwords
+    password = "a" * 72 + "correct"
+    client.post("/auth/register", json={"email": "long@example.com", "password": password})
+    
+    response = client.post(
+        "/auth/login",
+        data={"username": "long@example.com", "password": "a" * 72 + "wrong"}
+    )
+    assert response.status_code == 401
+    
+    response = client.post(
+        "/auth/login",
+        data={"username": "long@example.com", "password": password}
+    )
+    assert response.status_code == 200
+
+def test_login_retry_returns_same_token(client: TestClient, test_user, monkeypatch):
+    client.post("/auth/register", json=test_user)
+    login_data = {"username": test_user["email"], "password": test_user["password"]}
+    calls = {"authenticate": 0}
+    original_authenticate = crud.authenticate_user
+    
+    async def counting_authenticate(*args, **kwargs):
+        calls["authenticate"] += 1
+        return await original_authenticate(*args, **kwargs)
+    
+    monkeypatch.setattr(crud, "authenticate_user", counting_authenticate)
+    
+    first = client.post("/auth/login", data=login_data)
+    second = client.post("/auth/login", data=login_data)
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json()["access_token"] == first.json()["access_token"]
+    # The retry is served from the login cache without running bcrypt
+    assert calls["authenticate"] == 1
+    
+    clear_auth_caches()
+    assert client.post("/auth/login", data=login_data).status_code == 200
+    assert calls["authenticate"] == 2
+    
+    # A cached success must not let a wrong password through
+    response = client.post(
+        "/auth/login",
+        data={"username": test_user["email"], "password": "wrongpassword"}
+    )
+    assert response.status_code == 401
+    assert calls["authenticate"] == 3
+
+def test_login_upgrades_legacy_password_hash(client: TestClient, db_session):
+    # Hash as stored before SHA-256 pre-hashing: bcrypt of the raw password
+    legacy_hash = bcrypt.hashpw(b"legacypass123", bcrypt.gensalt(rounds=4)).decode()
+    db_session.add(models.User(email="legacy@example.com", hashed_password=legacy_hash))
+    db_session.commit()
+    
+    response = client.post(
+        "/auth/login",
+        data={"username": "legacy@example.com", "password": "wrongpassword"}
+    )
+    assert response.status_code == 401
+    
+    response = client.post(
+        "/auth/login",
+        data={"username": "legacy@example.com", "password": "legacypass123"}
+    )
+    assert response.status_code == 200
+    
+    # The stored hash was upgraded and still verifies
+    db_session.expire_all()
+    user = db_session.query(models.User).filter_by(email="legacy@example.com").one()
+    db_session.commit()
+    assert not crud.password_needs_rehash(user.hashed_password)
+    assert crud.verify_password("legacypass123", user.hashed_password)
+    assert not crud.verify_password("wrongpassword", user.hashed_password)
+
+def _b64url(data: dict) -> str:
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def _tampered_token(email: str) -> str:
+    # Valid token for another user, with the payload swapped for ours
+    header, _, signature = create_access_token(
+        data={"sub": "someone-else@example.com"}, expires_delta=timedelta(minutes=5)
+    ).split(".")
+    exp = int(time.time()) + 300
+    return f"{header}.{_b64url({'sub': email, 'exp': exp})}.{signature}"
+
+def _hs512_header_token(email: str) -> str:
+    # Signed with HS256 under the right key, but the header claims HS512
+    exp = int(time.time()) + 300
+    signing_input = f"{_b64url({'alg': 'HS512', 'typ': 'JWT'})}.{_b64url({'sub': email, 'exp': exp})}"
+    signature = hmac.new(SECRET_KEY.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{base64.urlsafe_b64encode(signature).rstrip(b'=').decode()}"
+
+@pytest.mark.parametrize("make_token", [
+    pytest.param(
+        lambda email: jwt.encode(
+            {"sub": email, "exp": datetime.utcnow() + timedelta(minutes=5)},
+            "not-the-secret-key",
+            algorithm="HS256",
+        ),
+        id="wrong-key",
+    ),
+    pytest.param(
+        lambda email: jwt.encode(
+            {"sub": email, "exp": datetime.utcnow() + timedelta(minutes=5)},
+            None,
+            algorithm="none",
+        ),
+        id="alg-none",
+    ),
+    pytest.param(
+        lambda email: create_access_token(
+            data={"sub": email}, expires_delta=timedelta(minutes=-1)
+        ),
+        id="expired",
+    ),
+    pytest.param(
+        lambda email: jwt.encode(
+            {"exp": datetime.utcnow() + timedelta(minutes=5)},
+            SECRET_KEY,
+            algorithm=ALGORITHM,
+        ),
+        id="missing-sub",
+    ),
+    pytest.param(_tampered_token, id="tampered-payload"),
+    pytest.param(_hs512_header_token, id="hs512-header"),
+    pytest.param(lambda email: "nodotsinthistoken", id="no-dots"),
+])
+def test_invalid_tokens_rejected(client: TestClient, test_user, make_token):
+    client.post("/auth/register", json=test_user)
+    token = make_token(test_user["email"])
+    
+    response = client.get("/tasks/", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Could not validate credentials"
+
+def test_cached_token_rejected_after_expiry(client: TestClient, test_user):
+    client.post("/auth/register", json=test_user)
+    token = create_access_token(
+        data={"sub": test_user["email"]}, expires_delta=timedelta(seconds=1)
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    # First request decodes the token and caches it
+    assert client.get("/tasks/", headers=headers).status_code == 200
+    
+    time.sleep(1.1)
+    response = client.get("/tasks/", headers=headers)
+    assert response.status_code == 401
+
+def test_auth_caches_skip_decode_and_lookup(authenticated_client: TestClient, monkeypatch):
+    calls = {"decode": 0, "lookup": 0}
+    original_decode = jwt.decode
+    original_lookup = crud.get_user_by_email
+    
+    def counting_decode(*args, **kwargs):
+        calls["decode"] += 1
+        return original_decode(*args, **kwargs)
+    
+    async def counting_lookup(*args, **kwargs):
+        calls["lookup"] += 1
+        return await original_lookup(*args, **kwargs)
+    
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    monkeypatch.setattr(crud, "get_user_by_email", counting_lookup)
+    
+    assert authenticated_client.get("/tasks/").status_code == 200
+    assert calls == {"decode": 1, "lookup": 1}
+    
+    # Second request is served from the token and user caches
+    response = authenticated_client.post("/tasks/", json={"title": "Cached user"})
+    assert response.status_code == 200
+    assert calls == {"decode": 1, "lookup": 1}
+    
+    clear_auth_caches()
+    assert authenticated_client.get("/tasks/").status_code == 200
+    assert calls == {"decode": 2, "lookup": 2}
+
+@pytest.mark.asyncio
+async def test_cached_user_snapshot_has_all_columns(async_db):
+    created = await crud.create_user(
+        async_db, schemas.UserCreate(email="snap@example.com", password="password123")
+    )
+    
+    await auth._get_user_cached(async_db, "snap@example.com")
+    async_db.expunge_all()
+    cached = await auth._get_user_cached(async_db, "snap@example.com")
+    
+    # Merged from the snapshot, with every column loaded (no lazy load needed)
+    assert cached is not created
+    assert sa_inspect(cached).unloaded == {"tasks"}
+    assert cached.id == created.id
+    assert cached.task_count == 0
\ No newline at end of file
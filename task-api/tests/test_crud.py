@@ -0,0 +1,24 @@
+import pytest
+from app import crud, schemas
+
+@pytest.mark.asyncio
+async def test_get_users_by_emails(async_db):
+    users = {}
+    for email in ["a@example.com", "b@example.com", "c@example.com"]:
+        users[email] = await crud.create_user(
+            async_db, schemas.UserCreate(email=email, password="password123")
+        )
+    
+    found = await crud.get_users_by_emails(
+        async_db,
+        ["a@example.com", "c@example.com", "a@example.com", "missing@example.com"]
+    )
+    # Duplicates collapse and unknown emails are left out
+    assert set(found) == {"a@example.com", "c@example.com"}
+    assert found["a@example.com"].id == users["a@example.com"].id
+    assert found["c@example.com"].id == users["c@example.com"].id
+
+@pytest.mark.asyncio
+async def test_get_users_by_emails_empty(async_db):
+    assert await crud.get_users_by_emails(async_db, []) == {}
+    assert await crud.get_users_by_emails(async_db, ["nobody@example.com"]) == {}
\ No newline at end of file
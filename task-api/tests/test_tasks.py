@@ -0,0 +1,156 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from app import models
+from app.routers.tasks import MAX_BULK_TASKS
+
+def test_create_tasks_bulk(authenticated_client: TestClient):
+    tasks = [
+        {"title": "First task", "priority": "high"},
+        {"title": "Second task", "description": "With a description"},
+        {"title": "Third task"},
+    ]
+    response = authenticated_client.post("/tasks/bulk", json=tasks)
+    assert response.status_code == 200
+    data = response.json()
+    assert [task["title"] for task in data] == [task["title"] for task in tasks]
+    assert data[0]["priority"] == "high"
+    assert data[1]["description"] == "With a description"
+    assert all(task["status"] == "todo" for task in data)
+    
+    # Created tasks are visible through the regular listing
+    response = authenticated_client.get("/tasks/")
+    assert response.status_code == 200
+    assert {task["id"] for task in response.json()} == {task["id"] for task in data}
+
+def test_create_tasks_bulk_empty(authenticated_client: TestClient):
+    response = authenticated_client.post("/tasks/bulk", json=[])
+    assert response.status_code == 200
+    assert response.json() == []
+
+def test_create_tasks_bulk_validation(authenticated_client: TestClient):
+    response = authenticated_client.post(
+        "/tasks/bulk",
+        json=[{"title": "Valid"}, {"title": ""}]
+    )
+    assert response.status_code == 422
+    
+    # Nothing is created when any item is invalid
+    response = authenticated_client.get("/tasks/")
+    assert response.json() == []
+
+def test_create_tasks_bulk_size_limit(authenticated_client: TestClient):
+    response = authenticated_client.post(
+        "/tasks/bulk",
+        json=[{"title": f"Task {i}"} for i in range(MAX_BULK_TASKS)]
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == MAX_BULK_TASKS
+    
+    response = authenticated_client.post(
+        "/tasks/bulk",
+        json=[{"title": f"Task {i}"} for i in range(MAX_BULK_TASKS + 1)]
+    )
+    assert response.status_code == 422
+    
+    # The oversized batch created nothing
+    response = authenticated_client.get("/tasks/")
+    assert response.headers["X-Total-Count"] == str(MAX_BULK_TASKS)
+
+def test_create_tasks_bulk_requires_auth(client: TestClient):
+    response = client.post("/tasks/bulk", json=[{"title": "Task"}])
+    assert response.status_code == 401
+
+def test_update_task(authenticated_client: TestClient, db_session):
+    created = authenticated_client.post("/tasks/", json={"title": "Original"}).json()
+    
+    # Backdate the task so the update must visibly move updated_at forward
+    seeded_at = datetime(2000, 1, 1)
+    db_session.query(models.Task).filter_by(id=created["id"]).update({"updated_at": seeded_at})
+    db_session.commit()
+    
+    response = authenticated_client.put(
+        f"/tasks/{created['id']}",
+        json={"title": "Updated", "status": "in_progress"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "Updated"
+    assert data["status"] == "in_progress"
+    assert data["priority"] == created["priority"]
+    assert datetime.fromisoformat(data["updated_at"]) > seeded_at
+
+def test_update_task_not_found(authenticated_client: TestClient):
+    response = authenticated_client.put("/tasks/999", json={"title": "Missing"})
+    assert response.status_code == 404
+
+def test_delete_task(authenticated_client: TestClient):
+    created = authenticated_client.post("/tasks/", json={"title": "Doomed"}).json()
+    
+    response = authenticated_client.delete(f"/tasks/{created['id']}")
+    assert response.status_code == 200
+    
+    response = authenticated_client.get(f"/tasks/{created['id']}")
+    assert response.status_code == 404
+    
+    # Deleting again reports the task as missing
+    response = authenticated_client.delete(f"/tasks/{created['id']}")
+    assert response.status_code == 404
+
+def test_read_tasks_keyset_pagination(authenticated_client: TestClient):
+    created = authenticated_client.post(
+        "/tasks/bulk",
+        json=[{"title": f"Task {i}"} for i in range(5)]
+    ).json()
+    ids = [task["id"] for task in created]
+    
+    response = authenticated_client.get("/tasks/", params={"limit": 2})
+    assert response.status_code == 200
+    first_page = [task["id"] for task in response.json()]
+    assert first_page == ids[:2]
+    
+    response = authenticated_client.get(
+        "/tasks/", params={"after_id": first_page[-1], "limit": 2}
+    )
+    assert [task["id"] for task in response.json()] == ids[2:4]
+    
+    response = authenticated_client.get("/tasks/", params={"after_id": ids[-1]})
+    assert response.json() == []
+
+def test_read_tasks_total_count(authenticated_client: TestClient):
+    response = authenticated_client.get("/tasks/")
+    assert response.headers["X-Total-Count"] == "0"
+    
+    authenticated_client.post("/tasks/bulk", json=[{"title": "A"}, {"title": "B"}])
+    created = authenticated_client.post("/tasks/", json={"title": "C"}).json()
+    response = authenticated_client.get("/tasks/", params={"limit": 1})
+    assert len(response.json()) == 1
+    assert response.headers["X-Total-Count"] == "3"
+    
+    authenticated_client.delete(f"/tasks/{created['id']}")
+    # Deleting a missing task leaves the count alone
+    authenticated_client.delete(f"/tasks/{created['id']}")
+    response = authenticated_client.get("/tasks/")
+    assert response.headers["X-Total-Count"] == "2"
+
+def test_tasks_require_bearer_token(client: TestClient):
+    response = client.get("/tasks/")
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Not authenticated"
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    
+    response = client.get("/tasks/", headers={"Authorization": "Basic dXNlcjpwYXNz"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Not authenticated"
+    
+    response = client.get("/tasks/", headers={"Authorization": "Bearer not-a-jwt"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Could not validate credentials"
+
+def test_bearer_scheme_is_case_insensitive(authenticated_client: TestClient):
+    token = authenticated_client.headers["Authorization"].split(" ", 1)[1]
+    response = authenticated_client.get(
+        "/tasks/", headers={"Authorization": f"bearer {token}"}
+    )
+    assert response.status_code == 200
\ No newline at end of file